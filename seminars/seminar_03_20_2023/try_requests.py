@@ -44,13 +44,13 @@ def main() -> None:
     # 2.2 making pauses between requests to make them look more natural for a server
     response = requests.get(correct_url)
 
-    sleep_period = 10
+    sleep_period = 2
     print(f'Sleeping for {sleep_period}')
     time.sleep(sleep_period)
 
     response = requests.get(correct_url)
 
-    sleep_period = random.randrange(3, 7)
+    sleep_period = random.uniform(1, 3)
     print(f'Sleeping for {sleep_period}')
     time.sleep(sleep_period)
 
@@ -69,6 +69,18 @@ def main() -> None:
     print(response.request.headers)
     print(response.headers)
 
+    # 2.4 requests asks a server to compress a page and decompresses it transparently
+    # 'br' is added to the supported encodings automatically when 'brotli' is installed
+    response = requests.get(correct_url)
+    print(f'Supported encodings: {response.request.headers["Accept-Encoding"]}')
+    print(f'Page was sent with encoding: {response.headers.get("Content-Encoding")}')
+
+    # 2.5 reusing one connection for many requests to the same website
+    with requests.Session() as session:
+        for _ in range(3):
+            response = session.get(correct_url, timeout=5)
+            print(f'Response code is: {response.status_code}')
+
     # 3. working with responses
     # 3.1 getting HTML page content as a plain Python string
     response = requests.get(correct_url)
@@ -7,11 +7,43 @@ from urllib.parse import urlparse, urlunparse
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    import soupsieve as sv
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError:
     print('No libraries installed. Failed to import.')
 
 
+def show_css_selectors(soup: BeautifulSoup) -> None:
+    """
+    Demonstrates searching for elements by CSS selectors
+    """
+    # paragraphs of the article body found with a single selector
+    paragraphs = soup.select('div[itemprop="articleBody"] p')
+    print(f'Number of paragraphs: {len(paragraphs)}')
+
+    # When the same selector is used for many pages (for example, one per article),
+    # compile it once and reuse the compiled object instead of passing a string each time
+    body_selector = sv.compile('div[itemprop="articleBody"] p')
+    links_selector = sv.compile('a[href^="/text/"]')
+
+    print(f'Number of paragraphs: {len(body_selector.select(soup))}')
+
+    # iselect returns a generator: links are processed one by one without building a list
+    for link in links_selector.iselect(soup):
+        print(f'Found an article link: {link["href"]}')
+        break
+
+
+def show_soup_strainer(content: bytes) -> None:
+    """
+    Demonstrates parsing only the necessary tags of a page
+    """
+    # a seed page is needed only for its links, so other tags are skipped while parsing
+    only_links = SoupStrainer('a')
+    links_soup = BeautifulSoup(content, 'lxml', parse_only=only_links)
+    print(f'Number of links: {len(links_soup.find_all("a"))}')
+
+
 def main() -> None:
     """
     Entrypoint for a seminar's listing
@@ -23,7 +55,7 @@ def main() -> None:
 
     # 1. Creating instance of soup
     # install 'lxml' first or remove it from arguments below
-    soup = BeautifulSoup(response.text, 'lxml')
+    soup = BeautifulSoup(response.content, 'lxml')
 
     # 2. Getting tags by dot notation
     print(soup.title)
@@ -95,6 +127,12 @@ def main() -> None:
         # skipping all other links - remove break if you want all links to be processed
         break
 
+    # 9. Find elements by CSS selectors
+    show_css_selectors(soup)
+
+    # 10. Parse only the tags you need
+    show_soup_strainer(response.content)
+
 
 if __name__ == '__main__':
     main()
@@ -16,7 +16,7 @@ Seminar that kicks-off HTMLParser
 
 try:
     import requests
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
 except ImportError:
     print('No libraries installed. Failed to import.')
 
@@ -29,7 +29,9 @@ def main() -> None:
     response = requests.get(url, timeout=5)
     print(response.status_code)
 
-    main_bs = BeautifulSoup(response.text, 'lxml')
+    # only title and text are needed, so other tags are not added to the tree
+    only_article = SoupStrainer(attrs={'itemprop': ['headline', 'articleBody']})
+    main_bs = BeautifulSoup(response.content, 'lxml', parse_only=only_article)
 
     # Idea no. 1: by tag name
     # Idea no. 2: by class name
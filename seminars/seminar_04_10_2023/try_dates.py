@@ -2,6 +2,7 @@
 """
 Lecture on dates
 """
+import re
 from datetime import datetime
 
 try:
@@ -11,6 +12,13 @@ except ImportError:
     print('No libraries installed. Failed to import.')
 
 
+MONTHS = {
+    'янв': '01',
+    # other months are going here...
+    'апр': '04'
+}
+
+
 def main() -> None:
     """
     Entrypoint for module
@@ -36,12 +44,7 @@ def main() -> None:
 
     article_date_raw = '6 апр 23'
     print(f'Before replacement: {article_date_raw}')
-    months = {
-        'янв': '01',
-        # other months are going here...
-        'апр': '04'
-    }
-    for month_name, month_number in months.items():
+    for month_name, month_number in MONTHS.items():
         if month_name in article_date_raw:
             article_date_raw = article_date_raw.replace(
                 month_name,
@@ -54,13 +57,26 @@ def main() -> None:
     )
     print(article_date)
 
+    # 1.1 The same without checking every month: take the date apart with one
+    # regular expression and look the month up in the dictionary by its first three
+    # letters, so that inflected forms like 'апреля' are found as well
+    article_date_raw = '6 апреля 23'
+    date_match = re.match(r'(\d{1,2}) (\w+) (\d{2})', article_date_raw)
+    if date_match:
+        day, month_name, year = date_match.groups()
+        article_date = datetime.strptime(
+            f'{day} {MONTHS[month_name[:3]]} {year}',
+            '%d %m %y'
+        )
+        print(article_date)
+
     # 2. Represent datetime in unified format
     final_date = datetime.strftime(article_date, '%Y:%m day: %d')
     print(final_date)
 
     url = 'https://www.nn.ru/text/education/2023/04/06/72194864/'
     response = requests.get(url, timeout=3)
-    main_bs = BeautifulSoup(response.text, 'lxml')
+    main_bs = BeautifulSoup(response.content, 'lxml')
     title_bs = main_bs.find('time')
     date_raw = str(title_bs.get('datetime'))
     date_parsed = datetime.strptime(
@@ -71,18 +87,13 @@ def main() -> None:
 
     url = 'https://nnov.hse.ru/ba/ling/students/news/825211450.html'
     response = requests.get(url, timeout=3)
-    main_bs = BeautifulSoup(response.text, 'lxml')
+    main_bs = BeautifulSoup(response.content, 'lxml')
     day_bs = main_bs.find('div', class_='post-meta__day')
     month_bs = main_bs.find('div', class_='post-meta__month')
     year_bs = main_bs.find('div', class_='post-meta__year')
     date_raw = f'{day_bs.text} {month_bs.text} {year_bs.text}'
     print(f'Before: {date_raw}')
-    months = {
-        'янв': '01',
-        # other months are going here...
-        'апр': '04'
-    }
-    for month_name, month_number in months.items():
+    for month_name, month_number in MONTHS.items():
         if month_name in date_raw:
             date_raw = date_raw.replace(
                 month_name,